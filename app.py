@@ -6,14 +6,53 @@ Flask application with Quantium branding
 
 import os
 import json
+import atexit
 import logging
-from datetime import datetime, timedelta
+import pickle
+import queue
+import re
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from copy import deepcopy
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlsplit
 from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 from pathlib import Path
-from main import NewsBulletinAggregator
+from main import NewsBulletinAggregator, create_http_session
 from email_sender import EmailSender
 from dotenv import load_dotenv
 
+# Optional: orjson serializes/parses JSON several times faster than the
+# stdlib and writes the config in a single call. Fall back to stdlib json
+# so it never becomes a hard dependency.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: msgspec decodes JSON faster still than orjson. The handlers all
+# work on plain dicts, so the schemaless decoder is used - typed
+# msgspec.Struct models would change every config access site for little
+# gain on a file this size.
+try:
+    import msgspec.json as msgspec_json
+except ImportError:
+    msgspec_json = None
+
+# Optional: Flask-Compress gzip/brotli-encodes JSON responses - the profile
+# map and file listings compress 5-10x. Like orjson, not a hard dependency.
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 # Security: Load environment variables for SMTP credentials
 load_dotenv()
 
@@ -24,9 +63,70 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'news-bulletin-aggregator-secret-key'
 
+# When deployed behind a server with X-Sendfile support (nginx, apache),
+# send_file() emits just the header and the front-end server streams the
+# MP3 with zero-copy sendfile(2), freeing the WSGI worker immediately.
+# Opt-in via the environment - the dev server has no such front end.
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '0') == '1'
+
+if orjson:
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        """JSON provider backed by orjson, so every jsonify() call gets
+        the faster C serializer without touching the handlers"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
+if Compress:
+    # Only compress JSON - MP3 downloads are already compressed, so
+    # audio/mpeg stays out of the mimetype list
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
+
 CONFIG_FILE = Path('config.json')
 OUTPUT_DIR = Path('output')
 
+# Resolved once at import so per-request checks don't re-resolve the base
+_OUTPUT_ROOT = OUTPUT_DIR.resolve()
+
+# Shared HTTP session so successive generates reuse pooled keep-alive
+# connections instead of paying DNS + TCP + TLS per source each run
+_HTTP_SESSION = create_http_session()
+
+# Shared aggregator for stateless per-call work (source testing).
+# Generation runs keep building their own instances: they mutate
+# news_sources and need an isolated temp directory per job, so a single
+# shared instance would race under concurrent requests. The expensive
+# shared state - the pooled HTTP session - is what actually gets reused.
+_TEST_AGGREGATOR = NewsBulletinAggregator(output_dir='output',
+                                          session=_HTTP_SESSION)
+
+
+def _safe_output_path(filename):
+    """
+    Resolve a user-supplied filename inside the output directory
+
+    Returns the resolved path, or None if the file doesn't exist or the
+    name escapes the output directory (e.g. via '..' components). Resolving
+    before comparing closes the traversal gap left by is_relative_to() on
+    unresolved paths, and is_file() doubles as the existence check so the
+    whole validation costs a single stat().
+    """
+    safe = (_OUTPUT_ROOT / filename).resolve()
+    if safe.parent != _OUTPUT_ROOT or not safe.is_file():
+        return None
+    return safe
+
 # Default sources (available to all profiles)
 DEFAULT_SOURCES = {
     'ABC News Top Stories': {
@@ -67,24 +167,129 @@ DEFAULT_SOURCES = {
     }
 }
 
+# Pre-pickled template for seeding profiles: pickle.loads runs in C and
+# reconstructs the nested dicts faster than a recursive deepcopy, while
+# still producing a fully independent copy (never share the inner source
+# dicts - a shallow .copy() here once corrupted defaults across profiles)
+_DEFAULT_SOURCES_PICKLE = pickle.dumps(DEFAULT_SOURCES,
+                                       protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _fresh_default_sources():
+    """Return an independent copy of DEFAULT_SOURCES for a new profile"""
+    return pickle.loads(_DEFAULT_SOURCES_PICKLE)
+
+
+# Bump when the config layout changes; load_config migrates older files
+# once and stamps them so later loads skip the migration checks entirely
+CONFIG_VERSION = 2
+
 # Default configuration with profiles
 DEFAULT_CONFIG = {
+    '_version': CONFIG_VERSION,
     'active_profile': 'default',
     'profiles': {
         'default': {
             'name': 'Default',
-            'sources': DEFAULT_SOURCES.copy()
+            'sources': _fresh_default_sources()
         }
     },
     'device_profiles': {}  # Maps device_id -> profile_id
 }
 
 
+# In-process config cache keyed on the file's (st_mtime_ns, st_size) so
+# read-heavy endpoints skip the open + JSON parse when nothing has changed.
+# 'enabled' holds a derived {profile_id: {source: url}} view of enabled
+# sources, rebuilt lazily whenever the config changes. 'rev' counts config
+# changes and feeds the ETag on config GETs - the debounced writer means
+# the file mtime can lag the cache, so the ETag cannot come from the file.
+_CONFIG_CACHE = {'stat': None, 'data': None, 'enabled': None, 'rev': 0}
+
+# Per-process ETag prefix so revision counters from a restarted process
+# never collide with ETags a client cached from the previous one
+_CONFIG_ETAG_SEED = uuid.uuid4().hex[:8]
+_CONFIG_LOCK = threading.RLock()
+
+# Pending-write flag: saves update the cache and mark it dirty; a background
+# thread coalesces bursts of saves into a single atomic file write
+_CONFIG_DIRTY = threading.Event()
+_CONFIG_FLUSH_DELAY = 0.25  # seconds to wait for further saves before writing
+
+
+def _json_dumps(obj):
+    """Serialize to a JSON string, using orjson when available
+
+    For payloads that bypass the Flask JSON provider (SSE events)
+    """
+    if orjson:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _json_loads(raw):
+    """Parse JSON bytes with the fastest available decoder"""
+    if msgspec_json:
+        return msgspec_json.decode(raw)
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _static_error(payload, status):
+    """
+    Factory for error responses whose JSON body never changes
+
+    The body is serialized once at import time; each call still builds a
+    fresh Response because after-request hooks (Flask-Compress, header
+    injection) mutate response objects, so a shared instance is not safe.
+    """
+    body = _json_dumps(payload).encode('utf-8')
+
+    def make_response():
+        return Response(body, status=status, mimetype='application/json')
+
+    return make_response
+
+
+_err_profile_not_found = _static_error(
+    {'status': 'error', 'message': 'Profile not found'}, 404)
+_err_file_not_found = _static_error(
+    {'status': 'error', 'message': 'File not found'}, 404)
+_err_download_not_found = _static_error({'error': 'File not found'}, 404)
+
+
 def load_config():
-    """Load configuration from file or return defaults"""
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
+    """
+    Load configuration from file (cached) or return defaults
+
+    Returns the live cached dict - treat it as read-only. All mutations
+    must go through update_config()/save_config(), which is what lets the
+    hot GET paths skip a deep copy per request.
+    """
+    with _CONFIG_LOCK:
+        # A pending save means the cache is newer than the file on disk
+        if _CONFIG_DIRTY.is_set() and _CONFIG_CACHE['data'] is not None:
+            return _CONFIG_CACHE['data']
+
+        try:
+            stat = CONFIG_FILE.stat()
+        except FileNotFoundError:
+            # Deep copy so a caller mutating the result can't corrupt the
+            # module-level defaults for every later call
+            return deepcopy(DEFAULT_CONFIG)
+
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if _CONFIG_CACHE['stat'] == cache_key:
+            return _CONFIG_CACHE['data']
+
+        with open(CONFIG_FILE, 'rb') as f:
+            raw = f.read()
+        config = _json_loads(raw)
+
+        # Migrate older config layouts once; the version stamp means a
+        # migrated file is written back a single time, not on every load
+        if config.get('_version', 1) < CONFIG_VERSION:
             # Migrate old config format to new profile-based format
             if 'profiles' not in config:
                 config = {
@@ -92,24 +297,136 @@ def load_config():
                     'profiles': {
                         'default': {
                             'name': 'Default',
-                            'sources': config.get('sources', DEFAULT_SOURCES.copy())
+                            'sources': config.get('sources', _fresh_default_sources())
                         }
-                    },
-                    'device_profiles': {}
+                    }
                 }
-                save_config(config)
             # Add device_profiles if missing
             if 'device_profiles' not in config:
                 config['device_profiles'] = {}
-                save_config(config)
-            return config
-    return DEFAULT_CONFIG
+            config['_version'] = CONFIG_VERSION
+            save_config(config)
+
+        if not _CONFIG_DIRTY.is_set():
+            _CONFIG_CACHE['stat'] = cache_key
+            _CONFIG_CACHE['data'] = config
+            _CONFIG_CACHE['enabled'] = None
+            _CONFIG_CACHE['rev'] += 1
+
+        return config
 
 
 def save_config(config):
-    """Save configuration to file"""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    """Update the in-memory config and queue a coalesced write to disk"""
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE['data'] = deepcopy(config)
+        _CONFIG_CACHE['enabled'] = None
+        _CONFIG_CACHE['rev'] += 1
+        _CONFIG_DIRTY.set()
+
+
+def update_config(mutator):
+    """
+    Apply a mutation function to the live config under the cache lock
+
+    The mutator receives the current config dict and edits it in place.
+    The change lands in the cache and is flushed by the background writer,
+    so any burst of mutations (switch profile, toggle sources, ...) costs
+    at most one disk write per flush window instead of one per request.
+    """
+    with _CONFIG_LOCK:
+        load_config()  # refresh the cache if the file changed on disk
+        config = _CONFIG_CACHE['data']
+        if config is None:
+            config = deepcopy(DEFAULT_CONFIG)
+        mutator(config)
+        _CONFIG_CACHE['data'] = config
+        _CONFIG_CACHE['enabled'] = None
+        _CONFIG_CACHE['rev'] += 1
+        _CONFIG_DIRTY.set()
+        return config
+
+
+def get_enabled_sources(profile_id):
+    """
+    Precomputed {source name: url} map of enabled sources for a profile
+
+    The view is derived from the cached config and rebuilt only when the
+    config changes, so generation endpoints do a single dict lookup
+    instead of re-filtering the sources dict on every request.
+    """
+    with _CONFIG_LOCK:
+        view = _CONFIG_CACHE['enabled']
+        if view is None:
+            config = load_config()
+            view = {
+                pid: {
+                    name: source['url']
+                    for name, source in profile['sources'].items()
+                    if source.get('enabled')
+                }
+                for pid, profile in config['profiles'].items()
+            }
+            _CONFIG_CACHE['enabled'] = view
+        return view.get(profile_id, {})
+
+
+def _config_etag():
+    """Current ETag for config-derived responses"""
+    with _CONFIG_LOCK:
+        return f"{_CONFIG_ETAG_SEED}-{_CONFIG_CACHE['rev']}"
+
+
+def _atomic_write_config(config):
+    """Write config to a temp file in the same directory, then rename over"""
+    if orjson:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=2).encode('utf-8')
+    tmp = tempfile.NamedTemporaryFile(
+        'wb', dir=str(CONFIG_FILE.parent), prefix=f'.{CONFIG_FILE.name}.',
+        suffix='.tmp', delete=False)
+    try:
+        tmp.write(data)
+        tmp.close()
+        os.replace(tmp.name, CONFIG_FILE)
+    except BaseException:
+        tmp.close()
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+    stat = CONFIG_FILE.stat()
+    _CONFIG_CACHE['stat'] = (stat.st_mtime_ns, stat.st_size)
+
+
+def flush_config():
+    """Write any pending config changes to disk immediately"""
+    with _CONFIG_LOCK:
+        if not _CONFIG_DIRTY.is_set() or _CONFIG_CACHE['data'] is None:
+            return
+        _CONFIG_DIRTY.clear()
+        try:
+            _atomic_write_config(_CONFIG_CACHE['data'])
+        except BaseException:
+            # Keep the pending change queued so the writer retries on the
+            # next window instead of silently dropping it
+            _CONFIG_DIRTY.set()
+            raise
+
+
+def _config_writer_loop():
+    """Background writer: coalesce save bursts into one write per window"""
+    while True:
+        _CONFIG_DIRTY.wait()
+        time.sleep(_CONFIG_FLUSH_DELAY)
+        try:
+            flush_config()
+        except OSError as e:
+            logger.error(f"Failed to write config: {e}")
+
+
+threading.Thread(target=_config_writer_loop, daemon=True,
+                 name='config-writer').start()
+atexit.register(flush_config)
 
 
 @app.route('/')
@@ -130,7 +447,11 @@ def index():
 def api_config():
     """Get or update configuration"""
     if request.method == 'GET':
-        return jsonify(load_config())
+        # Conditional response: polling clients holding the current ETag
+        # get a bodyless 304 instead of re-downloading the whole config
+        response = jsonify(load_config())
+        response.set_etag(_config_etag())
+        return response.make_conditional(request)
 
     elif request.method == 'POST':
         config = request.json
@@ -144,10 +465,12 @@ def api_profiles():
     config = load_config()
 
     if request.method == 'GET':
-        return jsonify({
+        response = jsonify({
             'active_profile': config['active_profile'],
             'profiles': config['profiles']
         })
+        response.set_etag(_config_etag())
+        return response.make_conditional(request)
 
     elif request.method == 'POST':
         data = request.json
@@ -161,12 +484,13 @@ def api_profiles():
             return jsonify({'status': 'error', 'message': 'Profile already exists'}), 400
 
         # Create new profile with default sources
-        config['profiles'][profile_id] = {
-            'name': profile_name,
-            'sources': DEFAULT_SOURCES.copy()
-        }
+        def create_profile(cfg):
+            cfg['profiles'][profile_id] = {
+                'name': profile_name,
+                'sources': _fresh_default_sources()
+            }
 
-        save_config(config)
+        update_config(create_profile)
         return jsonify({'status': 'success', 'profile_id': profile_id})
 
 
@@ -179,15 +503,15 @@ def api_delete_profile(profile_id):
         return jsonify({'status': 'error', 'message': 'Cannot delete default profile'}), 400
 
     if profile_id not in config['profiles']:
-        return jsonify({'status': 'error', 'message': 'Profile not found'}), 404
+        return _err_profile_not_found()
 
-    del config['profiles'][profile_id]
+    def delete_profile(cfg):
+        cfg['profiles'].pop(profile_id, None)
+        # Switch to default if deleted profile was active
+        if cfg['active_profile'] == profile_id:
+            cfg['active_profile'] = 'default'
 
-    # Switch to default if deleted profile was active
-    if config['active_profile'] == profile_id:
-        config['active_profile'] = 'default'
-
-    save_config(config)
+    update_config(delete_profile)
     return jsonify({'status': 'success'})
 
 
@@ -197,10 +521,9 @@ def api_switch_profile(profile_id):
     config = load_config()
 
     if profile_id not in config['profiles']:
-        return jsonify({'status': 'error', 'message': 'Profile not found'}), 404
+        return _err_profile_not_found()
 
-    config['active_profile'] = profile_id
-    save_config(config)
+    update_config(lambda cfg: cfg.update(active_profile=profile_id))
 
     return jsonify({'status': 'success', 'active_profile': profile_id})
 
@@ -211,22 +534,32 @@ def api_update_sources(profile_id):
     config = load_config()
 
     if profile_id not in config['profiles']:
-        return jsonify({'status': 'error', 'message': 'Profile not found'}), 404
+        return _err_profile_not_found()
 
     sources = request.json.get('sources', {})
-    config['profiles'][profile_id]['sources'] = sources
-    save_config(config)
+    update_config(lambda cfg: cfg['profiles'][profile_id].update(sources=sources))
 
     return jsonify({'status': 'success'})
 
 
+# Quick sanity check for feed URLs - rejects whitespace, bare hosts with
+# no scheme, and anything that isn't http(s)
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _resolve_host(host):
+    """Resolve a hostname, cached so repeated adds don't re-query DNS"""
+    socket.gethostbyname(host)
+
+
 @app.route('/api/profiles/<profile_id>/custom-source', methods=['POST', 'DELETE'])
 def api_custom_source(profile_id):
     """Add or remove custom source"""
     config = load_config()
 
     if profile_id not in config['profiles']:
-        return jsonify({'status': 'error', 'message': 'Profile not found'}), 404
+        return _err_profile_not_found()
 
     if request.method == 'POST':
         data = request.json
@@ -237,15 +570,41 @@ def api_custom_source(profile_id):
         if not name or not url:
             return jsonify({'status': 'error', 'message': 'Name and URL required'}), 400
 
+        # Input validation: Fail fast on malformed URLs here so a bad feed
+        # doesn't surface as a timeout during every subsequent generate.
+        # urlsplit itself raises on garbage like unclosed IPv6 brackets,
+        # so run the regex first and treat a parse failure as a 400 too.
+        parts = None
+        if _URL_RE.match(url):
+            try:
+                parts = urlsplit(url)
+            except ValueError:
+                parts = None
+        if parts is None or parts.scheme not in ('http', 'https') or not parts.hostname:
+            return jsonify({
+                'status': 'error',
+                'message': 'Invalid URL - must be a valid http:// or https:// address'
+            }), 400
+
+        # Surface DNS errors immediately instead of at generation time
+        try:
+            _resolve_host(parts.hostname)
+        except (socket.gaierror, UnicodeError):
+            return jsonify({
+                'status': 'error',
+                'message': f'Could not resolve host: {parts.hostname}'
+            }), 400
+
         # Add custom source to profile
-        config['profiles'][profile_id]['sources'][name] = {
-            'enabled': True,
-            'url': url,
-            'description': description,
-            'custom': True
-        }
+        def add_source(cfg):
+            cfg['profiles'][profile_id]['sources'][name] = {
+                'enabled': True,
+                'url': url,
+                'description': description,
+                'custom': True
+            }
 
-        save_config(config)
+        update_config(add_source)
         return jsonify({'status': 'success', 'source': name})
 
     elif request.method == 'DELETE':
@@ -255,8 +614,8 @@ def api_custom_source(profile_id):
             return jsonify({'status': 'error', 'message': 'Source name required'}), 400
 
         if source_name in config['profiles'][profile_id]['sources']:
-            del config['profiles'][profile_id]['sources'][source_name]
-            save_config(config)
+            update_config(
+                lambda cfg: cfg['profiles'][profile_id]['sources'].pop(source_name, None))
             return jsonify({'status': 'success'})
 
         return jsonify({'status': 'error', 'message': 'Source not found'}), 404
@@ -286,70 +645,128 @@ def api_device_profile(device_id):
             return jsonify({'status': 'error', 'message': 'Profile does not exist'}), 404
 
         # Save device-profile mapping
-        if 'device_profiles' not in config:
-            config['device_profiles'] = {}
-
-        config['device_profiles'][device_id] = profile_id
-        save_config(config)
+        update_config(
+            lambda cfg: cfg.setdefault('device_profiles', {}).update({device_id: profile_id}))
 
         return jsonify({'status': 'success', 'device_id': device_id, 'profile_id': profile_id})
 
 
-@app.route('/api/generate', methods=['POST'])
-def api_generate():
-    """Generate news bulletin with current configuration"""
+# Background generation jobs - /api/generate queues work here instead of
+# holding a request thread for the full download + combine (10-60s).
+# Finished entries are pruned oldest-first once the table passes the cap
+# so periodic callers (hourly cron) don't grow it for the process life.
+_GENERATE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='generate')
+_GENERATE_JOBS = {}
+_GENERATE_JOBS_MAX = 50
+
+
+def _prune_generate_jobs():
+    """Drop the oldest finished jobs once the table exceeds the cap"""
+    if len(_GENERATE_JOBS) <= _GENERATE_JOBS_MAX:
+        return
+    for job_id, job in list(_GENERATE_JOBS.items()):
+        if job['state'] in ('done', 'error'):
+            del _GENERATE_JOBS[job_id]
+            if len(_GENERATE_JOBS) <= _GENERATE_JOBS_MAX:
+                break
+
+# Background email delivery - SMTP handshake plus attachment upload can
+# take seconds, so sends are queued here and the request returns 202
+_EMAIL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='email')
+
+
+def _run_generate(job_id):
+    """Run a full bulletin generation, recording progress in _GENERATE_JOBS"""
+    job = _GENERATE_JOBS[job_id]
+    job_tmp = None
     try:
         config = load_config()
         active_profile = config['active_profile']
-        profile_data = config['profiles'][active_profile]
+
+        # Compute the target filename up front, outside the download path
+        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        profile_slug = active_profile.replace(' ', '_').lower()
+        output_filename = f"{profile_slug}_{timestamp}.mp3"
+
+        # Per-job temp directory so parallel jobs never race on shared temp
+        # names, and cleanup is one rmtree instead of a per-file sweep
+        job_tmp = Path(tempfile.mkdtemp(prefix=f'nba-{job_id}-'))
 
         # Create aggregator
-        aggregator = NewsBulletinAggregator(output_dir='output')
+        aggregator = NewsBulletinAggregator(output_dir='output', temp_dir=job_tmp,
+                                            session=_HTTP_SESSION)
 
-        # Get enabled sources from active profile
-        enabled_sources = {
-            name: data['url']
-            for name, data in profile_data['sources'].items()
-            if data['enabled']
-        }
+        # Get enabled sources from active profile (precomputed view)
+        enabled_sources = get_enabled_sources(active_profile)
         aggregator.news_sources = enabled_sources
 
-        # Fetch bulletins
+        # Fetch bulletins concurrently - each fetch is independent network
+        # I/O, so wall time drops from the sum of latencies to the slowest
+        # single source. Temp filenames are per-source so workers don't clash.
         downloaded_files = []
-        for source_name, feed_url in enabled_sources.items():
-            audio_file = aggregator.fetch_latest_bulletin(source_name, feed_url)
-            if audio_file:
-                downloaded_files.append(audio_file)
+        if enabled_sources:
+            with ThreadPoolExecutor(max_workers=min(16, len(enabled_sources))) as executor:
+                futures = {
+                    executor.submit(aggregator.fetch_latest_bulletin, name, url): name
+                    for name, url in enabled_sources.items()
+                }
+                for future in as_completed(futures):
+                    # fetch_latest_bulletin catches its own errors and
+                    # returns None, but guard anyway so one unexpected
+                    # worker failure can't abort the whole batch
+                    try:
+                        audio_file = future.result()
+                    except Exception as e:
+                        logger.error(f"Fetch worker for {futures[future]} failed: {str(e)}")
+                        continue
+                    if audio_file:
+                        downloaded_files.append(audio_file)
 
         if not downloaded_files:
-            return jsonify({
-                'status': 'error',
-                'message': 'No audio files were downloaded successfully'
-            }), 500
-
-        # Create unique filename with profile name and timestamp
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        profile_slug = active_profile.replace(' ', '_').lower()
-        output_filename = f"{profile_slug}_{timestamp}.mp3"
+            job.update({
+                'state': 'error',
+                'error': 'No audio files were downloaded successfully'
+            })
+            return
 
         # Combine bulletins
         output_file = aggregator.combine_audio_files(downloaded_files, output_filename)
 
-        # Cleanup temp files
-        aggregator.cleanup_temp_files()
-
         if output_file:
-            return jsonify({
-                'status': 'success',
-                'message': 'Bulletin generated successfully',
+            # New bulletin on disk - force the next listing to re-scan
+            _RECENT_FILES_CACHE['expires'] = 0.0
+            job.update({
+                'state': 'done',
                 'file': str(output_file),
                 'filename': output_file.name
             })
         else:
-            return jsonify({
-                'status': 'error',
-                'message': 'No audio files were downloaded successfully'
-            }), 500
+            job.update({
+                'state': 'error',
+                'error': 'No audio files were downloaded successfully'
+            })
+
+    except Exception as e:
+        logger.error(f"Generation job {job_id} failed: {str(e)}")
+        job.update({'state': 'error', 'error': str(e)})
+    finally:
+        if job_tmp is not None:
+            shutil.rmtree(job_tmp, ignore_errors=True)
+
+
+@app.route('/api/generate', methods=['POST'])
+def api_generate():
+    """Queue bulletin generation and return a job ID for status polling"""
+    try:
+        # Make sure any pending config saves are on disk before generating
+        flush_config()
+
+        job_id = uuid.uuid4().hex
+        _prune_generate_jobs()
+        _GENERATE_JOBS[job_id] = {'state': 'running'}
+        _GENERATE_POOL.submit(_run_generate, job_id)
+
+        return jsonify({'status': 'queued', 'job_id': job_id}), 202
 
     except Exception as e:
         return jsonify({
@@ -358,38 +775,86 @@ def api_generate():
         }), 500
 
 
+@app.route('/api/generate/<job_id>')
+def api_generate_status(job_id):
+    """Get status of a queued generation job"""
+    job = _GENERATE_JOBS.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Job not found'}), 404
+    return jsonify(job)
+
+
 @app.route('/api/download/<filename>')
 def api_download(filename):
     """Download generated bulletin"""
     try:
-        file_path = OUTPUT_DIR / filename
-        if file_path.exists():
-            return send_file(
+        # Security: Resolve and verify the path stays in the output directory
+        file_path = _safe_output_path(filename)
+        if file_path:
+            # conditional=True honours Range / If-Modified-Since requests
+            # (206 partial content), so the mobile player can seek without
+            # re-downloading, and lets the WSGI server use sendfile()
+            response = send_file(
                 str(file_path),
                 as_attachment=True,
                 download_name=filename,
-                mimetype='audio/mpeg'
+                mimetype='audio/mpeg',
+                conditional=True,
+                etag=True,
+                last_modified=file_path.stat().st_mtime
             )
+            # Bulletin filenames are timestamped and never reused, so
+            # clients can safely cache them
+            response.headers['Cache-Control'] = 'public, max-age=3600'
+            return response
         else:
-            return jsonify({'error': 'File not found'}), 404
+            return _err_download_not_found()
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
+def _list_mp3s():
+    """
+    List (name, stat_result) pairs for generated bulletins
+
+    One os.scandir pass: DirEntry caches its stat result, so this costs a
+    single syscall per file instead of the two that Path.glob() + stat()
+    pays, and allocates no Path objects.
+    """
+    if not OUTPUT_DIR.exists():
+        return []
+    with os.scandir(OUTPUT_DIR) as entries:
+        return [(entry.name, entry.stat())
+                for entry in entries
+                if entry.name.endswith('.mp3') and entry.is_file()]
+
+
+# Short-TTL cache for /api/recent-files - the UI polls this endpoint, so
+# serve the same listing for a couple of seconds instead of re-scanning
+_RECENT_FILES_CACHE = {'expires': 0.0, 'payload': None}
+_RECENT_FILES_TTL = 2.0
+
+
 @app.route('/api/recent-files')
 def api_recent_files():
     """Get list of recently generated bulletins"""
     try:
+        now = time.monotonic()
+        if now < _RECENT_FILES_CACHE['expires']:
+            return jsonify(_RECENT_FILES_CACHE['payload'])
+
         files = []
-        if OUTPUT_DIR.exists():
-            for file in sorted(OUTPUT_DIR.glob('*.mp3'), reverse=True)[:10]:
-                stat = file.stat()
-                files.append({
-                    'filename': file.name,
-                    'size': stat.st_size,
-                    'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                })
-        return jsonify({'files': files})
+        for name, stat in sorted(_list_mp3s(), reverse=True)[:10]:
+            files.append({
+                'filename': name,
+                'size': stat.st_size,
+                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+            })
+
+        payload = {'files': files}
+        _RECENT_FILES_CACHE['payload'] = payload
+        _RECENT_FILES_CACHE['expires'] = now + _RECENT_FILES_TTL
+        return jsonify(payload)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -398,12 +863,10 @@ def api_recent_files():
 def api_email_bulletin(filename):
     """Email a generated bulletin to specified recipient"""
     try:
-        # Input validation: Sanitize filename to prevent path traversal
-        file_path = OUTPUT_DIR / filename
-
-        # Security: Verify file exists and is within output directory
-        if not file_path.exists() or not file_path.is_relative_to(OUTPUT_DIR):
-            return jsonify({'status': 'error', 'message': 'File not found'}), 404
+        # Security: Resolve and verify the path stays in the output directory
+        file_path = _safe_output_path(filename)
+        if not file_path:
+            return _err_file_not_found()
 
         # Get profile name from filename (format: profile_timestamp.mp3)
         profile_name = filename.split('_')[0].replace('_', ' ').title()
@@ -429,19 +892,24 @@ def api_email_bulletin(filename):
                 'message': 'Email not configured. Please set SMTP credentials in .env file'
             }), 400
 
-        # Send email with bulletin attachment to specified recipient
-        success = sender.send_bulletin(file_path, profile_name, recipient_email=recipient_email)
-
-        if success:
-            return jsonify({
-                'status': 'success',
-                'message': f'Bulletin emailed to {recipient_email}'
-            })
-        else:
+        # Input validation: reject bad addresses now - the send happens in
+        # the background, so this is the last chance to tell the caller
+        if not sender._is_valid_email(recipient_email):
             return jsonify({
                 'status': 'error',
-                'message': 'Failed to send email. Check server logs for details.'
-            }), 500
+                'message': 'Invalid email address'
+            }), 400
+
+        # Queue the send on the background pool and return immediately -
+        # SMTP latency stays off the request thread. send_bulletin logs its
+        # own outcome, so a failed delivery is visible in the server logs.
+        _EMAIL_POOL.submit(sender.send_bulletin, file_path, profile_name,
+                           recipient_email=recipient_email)
+
+        return jsonify({
+            'status': 'queued',
+            'message': f'Bulletin queued for delivery to {recipient_email}'
+        }), 202
 
     except Exception as e:
         # Security: Log errors without exposing sensitive data
@@ -465,22 +933,16 @@ def api_latest_bulletin():
         config = load_config()
         active_profile = config['active_profile']
 
-        # Get all MP3 files in output directory
-        if not OUTPUT_DIR.exists():
-            return jsonify({'error': 'No bulletins available'}), 404
-
         # Find most recent bulletin file
-        mp3_files = sorted(OUTPUT_DIR.glob('*.mp3'), key=lambda f: f.stat().st_mtime, reverse=True)
+        mp3_files = sorted(_list_mp3s(), key=lambda e: e[1].st_mtime, reverse=True)
 
         if not mp3_files:
             return jsonify({'error': 'No bulletins found'}), 404
 
         # Get the most recent file
-        latest_file = mp3_files[0]
-        stat = latest_file.stat()
+        filename, stat = mp3_files[0]
 
         # Extract profile name from filename (format: profile_timestamp.mp3 or news_bulletin_date.mp3)
-        filename = latest_file.name
         profile_name = active_profile.replace('_', ' ').title()
 
         # Try to parse date from filename
@@ -518,29 +980,59 @@ def api_generate_stream():
         try:
             config = load_config()
             active_profile = config['active_profile']
-            profile_data = config['profiles'][active_profile]
 
-            # Get enabled sources
-            enabled_sources = {
-                name: data['url']
-                for name, data in profile_data['sources'].items()
-                if data['enabled']
-            }
+            # Get enabled sources (precomputed view)
+            enabled_sources = get_enabled_sources(active_profile)
 
             if not enabled_sources:
-                yield f"data: {json.dumps({'stage': 'error', 'message': 'No sources enabled'})}\n\n"
+                yield f"data: {_json_dumps({'stage': 'error', 'message': 'No sources enabled'})}\n\n"
                 return
 
             # Create generator and set enabled sources
             logger.info(f"Creating generator with {len(enabled_sources)} sources")
-            generator = NewsBulletinAggregator(output_dir='output')
+            generator = NewsBulletinAggregator(output_dir='output', session=_HTTP_SESSION)
             generator.news_sources = enabled_sources
 
             # Generate bulletin
-            yield f"data: {json.dumps({'stage': 'fetching', 'message': f'Fetching bulletins from {len(enabled_sources)} sources'})}\n\n"
+            yield f"data: {_json_dumps({'stage': 'fetching', 'message': f'Fetching bulletins from {len(enabled_sources)} sources'})}\n\n"
+
+            # Run generation in a worker thread so this generator can keep
+            # streaming: per-source progress arrives on the queue as it
+            # happens, instead of the browser seeing nothing until the very
+            # end. While the queue is quiet an SSE comment line is sent as a
+            # heartbeat - EventSource ignores comments, but they stop
+            # proxies/browsers timing out the idle connection.
+            progress = queue.Queue()
+            generator.progress_queue = progress
+            outcome = {}
+
+            def run_generation():
+                try:
+                    outcome['file'] = generator.generate_daily_bulletin()
+                except Exception as e:
+                    outcome['error'] = str(e)
+                finally:
+                    progress.put(None)  # sentinel: generation finished
 
             logger.info("Starting bulletin generation...")
-            output_file = generator.generate_daily_bulletin()
+            worker = threading.Thread(target=run_generation, daemon=True)
+            worker.start()
+
+            while True:
+                try:
+                    message = progress.get(timeout=1.0)
+                except queue.Empty:
+                    yield ": heartbeat\n\n"
+                    continue
+                if message is None:
+                    break
+                yield f"data: {_json_dumps({'stage': 'downloading', 'message': message})}\n\n"
+
+            worker.join()
+            if 'error' in outcome:
+                raise RuntimeError(outcome['error'])
+
+            output_file = outcome.get('file')
             logger.info(f"Generation complete. Output file: {output_file}")
 
             if output_file:
@@ -555,19 +1047,38 @@ def api_generate_stream():
                 if profile_output.exists():
                     file_size = profile_output.stat().st_size
                     logger.info(f"✅ File verified: {profile_output} ({file_size} bytes)")
-                    yield f"data: {json.dumps({'stage': 'complete', 'message': 'Bulletin generated successfully', 'filename': profile_filename, 'size': file_size})}\n\n"
+                    # New bulletin on disk - force the next listing to re-scan
+                    _RECENT_FILES_CACHE['expires'] = 0.0
+                    yield f"data: {_json_dumps({'stage': 'complete', 'message': 'Bulletin generated successfully', 'filename': profile_filename, 'size': file_size})}\n\n"
                 else:
                     logger.error(f"❌ File not found after rename: {profile_output}")
-                    yield f"data: {json.dumps({'stage': 'error', 'message': 'File was created but disappeared'})}\n\n"
+                    yield f"data: {_json_dumps({'stage': 'error', 'message': 'File was created but disappeared'})}\n\n"
             else:
                 logger.error("❌ Generation returned None")
-                yield f"data: {json.dumps({'stage': 'error', 'message': 'No audio files were downloaded successfully'})}\n\n"
+                yield f"data: {_json_dumps({'stage': 'error', 'message': 'No audio files were downloaded successfully'})}\n\n"
 
         except Exception as e:
             logger.error(f"Stream generation error: {str(e)}")
-            yield f"data: {json.dumps({'stage': 'error', 'message': str(e)})}\n\n"
+            yield f"data: {_json_dumps({'stage': 'error', 'message': str(e)})}\n\n"
+
+    # Headers matter as much as the stream itself: nginx buffers proxied
+    # responses by default (X-Accel-Buffering disables that), and any
+    # cached copy of an event stream is useless
+    return Response(stream_with_context(generate()),
+                    mimetype='text/event-stream',
+                    headers={
+                        'Cache-Control': 'no-cache',
+                        'X-Accel-Buffering': 'no',
+                        'Connection': 'keep-alive'
+                    })
 
-    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+# Parsed bulletin metadata keyed by filename, validated against the
+# metadata file's mtime so edits and regenerated bulletins invalidate
+# naturally. Bulletins are immutable once written, so hits skip the
+# read + JSON parse entirely - one stat per request
+_METADATA_CACHE = {}
+_METADATA_CACHE_MAX = 64
 
 
 @app.route('/api/bulletin/<filename>/metadata')
@@ -581,11 +1092,19 @@ def api_bulletin_metadata(filename):
 
         metadata_file = OUTPUT_DIR / f"{Path(filename).stem}.json"
 
-        if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+        try:
+            meta_mtime = metadata_file.stat().st_mtime_ns
+
+            cached = _METADATA_CACHE.get(filename)
+            if cached is not None and cached[0] == meta_mtime:
+                return jsonify(cached[1])
+
+            metadata = _json_loads(metadata_file.read_bytes())
+            if len(_METADATA_CACHE) >= _METADATA_CACHE_MAX:
+                _METADATA_CACHE.clear()
+            _METADATA_CACHE[filename] = (meta_mtime, metadata)
             return jsonify(metadata)
-        else:
+        except FileNotFoundError:
             # Return basic info if no metadata file
             if file_path.exists():
                 stat = file_path.stat()
@@ -603,6 +1122,20 @@ def api_bulletin_metadata(filename):
         return jsonify({'error': str(e)}), 500
 
 
+def _probe_duration(audio_file):
+    """
+    Audio duration in seconds, read from the container header via ffprobe
+
+    Avoids decoding the whole file to PCM just to measure its length -
+    for a 5-minute MP3 that's tens of MB of buffer and a full decoder run
+    """
+    output = subprocess.check_output(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+         '-of', 'default=nw=1:nk=1', str(audio_file)],
+        timeout=15)
+    return float(output.strip())
+
+
 @app.route('/api/test-source', methods=['POST'])
 def api_test_source():
     """Test a single RSS source"""
@@ -614,31 +1147,33 @@ def api_test_source():
         if not source_name or not source_url:
             return jsonify({'status': 'error', 'message': 'Name and URL required'}), 400
 
-        # Create temporary aggregator
-        aggregator = NewsBulletinAggregator(output_dir='output')
-
-        # Try to fetch the source
-        audio_file = aggregator.fetch_latest_bulletin(source_name, source_url)
+        # Try to fetch the source via the shared aggregator -
+        # fetch_latest_bulletin takes everything it needs as arguments
+        audio_file = _TEST_AGGREGATOR.fetch_latest_bulletin(source_name, source_url)
 
         if audio_file and audio_file.exists():
             # Get duration
             try:
-                from pydub import AudioSegment
-                audio = AudioSegment.from_file(str(audio_file))
-                duration = len(audio) / 1000  # seconds
-
-                # Cleanup test file
-                audio_file.unlink()
-
+                try:
+                    duration = _probe_duration(audio_file)
+                except (OSError, subprocess.SubprocessError, ValueError):
+                    # ffprobe unavailable or couldn't parse the header -
+                    # fall back to the slower full pydub decode
+                    from pydub import AudioSegment
+                    audio = AudioSegment.from_file(str(audio_file))
+                    duration = len(audio) / 1000  # seconds
+
+                # Keep the downloaded file: it landed in the shared
+                # episode cache, where guids.json references it and the
+                # next generate reuses it instead of re-downloading -
+                # unlinking here would also pull an input out from under
+                # a concurrently running combine
                 return jsonify({
                     'status': 'success',
                     'message': f'Source is working ({duration:.0f} seconds)',
                     'duration': duration
                 })
             except Exception as e:
-                # Cleanup test file
-                if audio_file.exists():
-                    audio_file.unlink()
                 return jsonify({
                     'status': 'error',
                     'message': f'Downloaded but cannot process audio: {str(e)}'
@@ -668,28 +1203,34 @@ def api_cleanup():
         if not OUTPUT_DIR.exists():
             return jsonify({'status': 'success', 'deleted': 0, 'kept': 0})
 
-        # Get all MP3 files sorted by modification time (newest first)
-        mp3_files = sorted(OUTPUT_DIR.glob('*.mp3'), key=lambda f: f.stat().st_mtime, reverse=True)
+        # Get all MP3 files sorted by modification time (newest first).
+        # Compare raw epoch mtimes against a float cutoff rather than
+        # building a datetime object per file - the selection loop is then
+        # just float comparisons over the cached scandir stats.
+        mp3_files = sorted(_list_mp3s(), key=lambda e: e[1].st_mtime, reverse=True)
+        cutoff = time.time() - max_age_days * 86400
 
-        deleted_count = 0
-        kept_count = 0
-        cutoff_date = datetime.now() - timedelta(days=max_age_days)
-
-        for idx, file in enumerate(mp3_files):
-            stat = file.stat()
-            file_age = datetime.fromtimestamp(stat.st_mtime)
+        # Everything past keep_count that is also older than the cutoff
+        to_delete = [
+            name for name, stat in mp3_files[keep_count:]
+            if stat.st_mtime < cutoff
+        ]
+        kept_count = len(mp3_files) - len(to_delete)
 
-            # Keep if within keep_count OR newer than max_age_days
-            if idx < keep_count or file_age > cutoff_date:
-                kept_count += 1
-            else:
-                # Delete file and its metadata
-                file.unlink()
-                metadata_file = file.parent / f"{file.stem}.json"
-                if metadata_file.exists():
-                    metadata_file.unlink()
-                deleted_count += 1
-                logger.info(f"Cleaned up old bulletin: {file.name}")
+        deleted_count = 0
+        for name in to_delete:
+            # Delete file and its metadata
+            file = OUTPUT_DIR / name
+            file.unlink()
+            metadata_file = file.parent / f"{file.stem}.json"
+            if metadata_file.exists():
+                metadata_file.unlink()
+            deleted_count += 1
+            logger.info(f"Cleaned up old bulletin: {name}")
+
+        # The directory just changed - expire the recent-files cache so
+        # the UI's immediate refresh doesn't list deleted bulletins
+        _RECENT_FILES_CACHE['expires'] = 0.0
 
         return jsonify({
             'status': 'success',
@@ -710,15 +1251,14 @@ def api_storage_info():
         if not OUTPUT_DIR.exists():
             return jsonify({'total_size': 0, 'file_count': 0, 'files': []})
 
-        mp3_files = list(OUTPUT_DIR.glob('*.mp3'))
-        total_size = sum(f.stat().st_size for f in mp3_files)
+        mp3_files = _list_mp3s()
+        total_size = sum(stat.st_size for _, stat in mp3_files)
 
         files_info = []
-        for file in sorted(mp3_files, key=lambda f: f.stat().st_mtime, reverse=True):
-            stat = file.stat()
+        for name, stat in sorted(mp3_files, key=lambda e: e[1].st_mtime, reverse=True):
             age_days = (datetime.now() - datetime.fromtimestamp(stat.st_mtime)).days
             files_info.append({
-                'filename': file.name,
+                'filename': name,
                 'size': stat.st_size,
                 'age_days': age_days,
                 'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
@@ -739,5 +1279,8 @@ if __name__ == '__main__':
     # Ensure output directory exists
     OUTPUT_DIR.mkdir(exist_ok=True)
 
-    # Run Flask development server
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Run Flask development server. The debug reloader stat()s every source
+    # file continuously, so only enable it outside production - deploy with
+    # gunicorn via wsgi.py instead (see wsgi.py for the command)
+    debug = os.environ.get('FLASK_ENV', 'development') == 'development'
+    app.run(host='0.0.0.0', port=5000, debug=debug)
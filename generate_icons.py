@@ -1,94 +1,127 @@
-#!/usr/bin/env python3
-"""
-Generate PWA icons for News Bulletin Aggregator
-Creates app icons in various sizes for iOS and Android
-"""
-
-from PIL import Image, ImageDraw
-import os
-from pathlib import Path
-
-# Icon sizes needed
-ICON_SIZES = [72, 96, 128, 144, 152, 192, 384, 512]
-OUTPUT_DIR = Path('static/icons')
-
-def create_icon(size, output_path, maskable=False):
-    """
-    Create a simple icon with Quantium branding
-
-    Args:
-        size: Icon size in pixels (square)
-        output_path: Path to save the icon
-        maskable: If True, adds safe area padding for maskable icons
-    """
-    # Create image with black background
-    img = Image.new('RGB', (size, size), color='#000000')
-    draw = ImageDraw.Draw(img)
-
-    # Calculate dimensions (with safe area for maskable icons)
-    if maskable:
-        # Maskable icons need 20% safe area (80% of icon is safe zone)
-        padding = size * 0.1  # 10% padding on each side
-        effective_size = size - (2 * padding)
-    else:
-        padding = size * 0.15  # 15% padding for standard icons
-        effective_size = size - (2 * padding)
-
-    # Draw circles (simplified Quantium logo)
-    centre_x = size / 2
-    centre_y = size / 2
-
-    # Main circle (yellow)
-    main_radius = effective_size * 0.35
-    draw.ellipse(
-        [centre_x - main_radius, centre_y - main_radius,
-         centre_x + main_radius, centre_y + main_radius],
-        fill='#FFE600'
-    )
-
-    # Inner circle (black)
-    inner_radius = main_radius * 0.4
-    draw.ellipse(
-        [centre_x - inner_radius, centre_y - inner_radius,
-         centre_x + inner_radius, centre_y + inner_radius],
-        fill='#000000'
-    )
-
-    # Bottom right accent circle (yellow)
-    accent_radius = main_radius * 0.25
-    accent_x = centre_x + main_radius * 0.8
-    accent_y = centre_y + main_radius * 0.8
-    draw.ellipse(
-        [accent_x - accent_radius, accent_y - accent_radius,
-         accent_x + accent_radius, accent_y + accent_radius],
-        fill='#FFE600'
-    )
-
-    # Save icon
-    img.save(output_path, 'PNG', optimize=True)
-    print(f"Created {output_path.name} ({size}x{size})")
-
-
-def main():
-    """Generate all required icons"""
-    # Create output directory
-    OUTPUT_DIR.mkdir(exist_ok=True)
-
-    print("Generating PWA icons...")
-
-    # Generate standard icons
-    for size in ICON_SIZES:
-        output_path = OUTPUT_DIR / f'icon-{size}.png'
-        create_icon(size, output_path, maskable=False)
-
-    # Generate maskable icons (Android adaptive icons)
-    for size in [192, 512]:
-        output_path = OUTPUT_DIR / f'icon-maskable-{size}.png'
-        create_icon(size, output_path, maskable=True)
-
-    print(f"\n✓ Generated {len(ICON_SIZES) + 2} icons in {OUTPUT_DIR}")
-    print("\nIcons are ready for PWA installation!")
-
-
-if __name__ == '__main__':
-    main()
+#!/usr/bin/env python3
+"""
+Generate PWA icons for News Bulletin Aggregator
+Creates app icons in various sizes for iOS and Android
+"""
+
+from PIL import Image, ImageDraw
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Icon sizes needed
+ICON_SIZES = [72, 96, 128, 144, 152, 192, 384, 512]
+OUTPUT_DIR = Path('static/icons')
+
+# Supersampled render size - each icon is a Lanczos downscale of this
+MASTER_SIZE = 2048
+
+
+def render_master(maskable=False):
+    """
+    Render the icon once at MASTER_SIZE
+
+    Each output size is then a Lanczos downscale of this master, which
+    antialiases the circle edges better than rasterising every size
+    directly and runs the ellipse drawing once per variant instead of
+    once per size.
+
+    Args:
+        maskable: If True, adds safe area padding for maskable icons
+
+    Returns:
+        PIL.Image of the full-size icon
+    """
+    size = MASTER_SIZE
+
+    # Create image with black background
+    img = Image.new('RGB', (size, size), color='#000000')
+    draw = ImageDraw.Draw(img)
+
+    # Calculate dimensions (with safe area for maskable icons)
+    if maskable:
+        # Maskable icons need 20% safe area (80% of icon is safe zone)
+        padding = size * 0.1  # 10% padding on each side
+        effective_size = size - (2 * padding)
+    else:
+        padding = size * 0.15  # 15% padding for standard icons
+        effective_size = size - (2 * padding)
+
+    # Draw circles (simplified Quantium logo)
+    centre_x = size / 2
+    centre_y = size / 2
+
+    # Main circle (yellow)
+    main_radius = effective_size * 0.35
+    draw.ellipse(
+        [centre_x - main_radius, centre_y - main_radius,
+         centre_x + main_radius, centre_y + main_radius],
+        fill='#FFE600'
+    )
+
+    # Inner circle (black)
+    inner_radius = main_radius * 0.4
+    draw.ellipse(
+        [centre_x - inner_radius, centre_y - inner_radius,
+         centre_x + inner_radius, centre_y + inner_radius],
+        fill='#000000'
+    )
+
+    # Bottom right accent circle (yellow)
+    accent_radius = main_radius * 0.25
+    accent_x = centre_x + main_radius * 0.8
+    accent_y = centre_y + main_radius * 0.8
+    draw.ellipse(
+        [accent_x - accent_radius, accent_y - accent_radius,
+         accent_x + accent_radius, accent_y + accent_radius],
+        fill='#FFE600'
+    )
+
+    return img
+
+
+def create_icon(master, size, output_path):
+    """
+    Save one icon size downscaled from a master render
+
+    Args:
+        master: Full-size icon image from render_master()
+        size: Icon size in pixels (square)
+        output_path: Path to save the icon
+    """
+    # compress_level=6 instead of optimize=True: optimize re-runs zlib
+    # with several strategies per image for a marginal size win
+    master.resize((size, size), Image.LANCZOS).save(output_path, 'PNG',
+                                                    compress_level=6)
+    print(f"Created {output_path.name} ({size}x{size})")
+
+
+def main():
+    """Generate all required icons"""
+    # Create output directory
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    print("Generating PWA icons...")
+
+    # One master render per variant; every size is a downscale of it
+    standard_master = render_master(maskable=False)
+    maskable_master = render_master(maskable=True)
+
+    # Standard icons plus maskable icons (Android adaptive icons)
+    jobs = [(standard_master, size, OUTPUT_DIR / f'icon-{size}.png')
+            for size in ICON_SIZES]
+    jobs += [(maskable_master, size, OUTPUT_DIR / f'icon-maskable-{size}.png')
+             for size in [192, 512]]
+
+    # Encode in parallel - Pillow's resize and PNG/zlib encode release
+    # the GIL in C, so the independent saves scale across cores
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for _ in executor.map(lambda job: create_icon(*job), jobs):
+            pass
+
+    print(f"\n✓ Generated {len(ICON_SIZES) + 2} icons in {OUTPUT_DIR}")
+    print("\nIcons are ready for PWA installation!")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,13 +4,26 @@ News Bulletin Aggregator - Combines daily news bulletins into one audio file
 """
 
 import os
+import json
 import logging
+import shutil
+import subprocess
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from io import BytesIO
+from xml.etree import ElementTree
 import feedparser
 import requests
-from pydub import AudioSegment
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+# pydub is imported lazily inside the combine path: importing it probes
+# for the ffmpeg binary, which fetch-only users of this module (the web
+# app's source tester, feed scripts) should not pay at import time
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -18,23 +31,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optional: mutagen reads MP3 stream parameters from the frame headers
+# in-process, replacing one ffprobe subprocess per file when probing for
+# the stream-copy concat fast path
+try:
+    from mutagen.mp3 import MP3 as MutagenMP3
+except ImportError:
+    MutagenMP3 = None
+
+
+def create_http_session():
+    """Create a requests.Session with a pooled adapter for feed downloads
+
+    Retries cover transient gateway errors from podcast CDNs with a short
+    backoff, so one flaky 503 doesn't drop a source from the bulletin.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5,
+                    status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                          max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class NewsBulletinAggregator:
     """Fetches and combines news bulletins from multiple sources"""
 
-    def __init__(self, output_dir='./output'):
+    def __init__(self, output_dir='./output', temp_dir=None, session=None):
         """
         Initialise the aggregator
 
         Args:
             output_dir: Directory to save downloaded and combined audio files
+            temp_dir: Directory for temporary downloads. Defaults to a 'temp'
+                subdirectory of output_dir; pass a dedicated directory to let
+                concurrent runs download without sharing temp files
+            session: Optional requests.Session to use for downloads. Pass a
+                shared session to reuse pooled connections across aggregator
+                instances; by default a pooled session is created per instance
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
         # Temporary directory for downloaded files
-        self.temp_dir = self.output_dir / 'temp'
-        self.temp_dir.mkdir(exist_ok=True)
+        self.temp_dir = Path(temp_dir) if temp_dir else self.output_dir / 'temp'
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+
+        # HTTP session with connection pooling - keep-alive avoids a fresh
+        # TCP + TLS handshake per feed/audio download
+        self.session = session if session is not None else create_http_session()
+
+        # Optional queue.Queue a caller can attach to receive progress
+        # messages (one per source) while generate_daily_bulletin runs
+        self.progress_queue = None
+
+        # Feed ETags persisted across runs so unchanged feeds can answer
+        # with a bodyless 304 instead of re-sending the whole XML
+        self._etag_file = self.output_dir / 'feed_etags.json'
+        self._etag_lock = threading.Lock()
+        try:
+            self._etags = json.loads(self._etag_file.read_text())
+        except (OSError, ValueError):
+            self._etags = {}
+
+        # Permanent cache holding the most recent audio file per source
+        # together with the feed GUID it came from, so re-runs skip the
+        # multi-MB download when the episode hasn't changed
+        self.cache_dir = self.output_dir / 'cache'
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._guid_file = self.output_dir / 'guids.json'
+        self._guid_lock = threading.Lock()
+        try:
+            self._guid_cache = json.loads(self._guid_file.read_text())
+        except (OSError, ValueError):
+            self._guid_cache = {}
 
         # News sources with RSS feed URLs (short bulletins: 1-5 minutes)
         self.news_sources = {
@@ -59,38 +131,117 @@ class NewsBulletinAggregator:
         """
         try:
             logger.info(f"Fetching latest bulletin from {source_name}...")
-            feed = feedparser.parse(feed_url)
-
-            if not feed.entries:
-                logger.warning(f"No entries found in {source_name} feed")
-                return None
-
-            # Get the latest entry
-            latest_entry = feed.entries[0]
-
-            # Find audio enclosure
-            audio_url = None
-            for enclosure in latest_entry.get('enclosures', []):
-                if 'audio' in enclosure.get('type', ''):
-                    audio_url = enclosure.get('href') or enclosure.get('url')
-                    break
-
-            if not audio_url:
-                logger.warning(f"No audio found in latest {source_name} bulletin")
-                return None
+            # Fetch the feed XML through the pooled session rather than
+            # letting feedparser open its own connection - the parse is
+            # then pure CPU on the downloaded bytes. A stored ETag makes
+            # the request conditional.
+            headers = {}
+            with self._etag_lock:
+                etag = self._etags.get(feed_url)
+            if etag:
+                headers['If-None-Match'] = etag
+
+            feed_response = self.session.get(feed_url, timeout=15,
+                                             headers=headers)
+            if feed_response.status_code == 304:
+                # Feed unchanged since last run - reuse the cached audio
+                # file if it survived, otherwise refetch in full
+                cached = next(
+                    (p for p in self.cache_dir.glob(f"{source_name.replace(' ', '_')}.*")
+                     if p.suffix != '.part'),
+                    None)
+                if cached is not None:
+                    logger.info(f"{source_name} feed unchanged (304); reusing {cached.name}")
+                    return cached
+                feed_response = self.session.get(feed_url, timeout=15)
+
+            feed_response.raise_for_status()
+
+            new_etag = feed_response.headers.get('ETag')
+            if new_etag:
+                self._store_etag(feed_url, new_etag)
+
+            # Only the newest item matters, so try a streaming parse that
+            # stops at the first <item> before letting feedparser chew
+            # through potentially hundreds of historical entries
+            latest = self._first_enclosure(feed_response.content)
+            if latest is None:
+                feed = feedparser.parse(feed_response.content)
+
+                if not feed.entries:
+                    logger.warning(f"No entries found in {source_name} feed")
+                    return None
+
+                # Get the latest entry
+                latest_entry = feed.entries[0]
+
+                # Find audio enclosure
+                audio_url = None
+                for enclosure in latest_entry.get('enclosures', []):
+                    if 'audio' in enclosure.get('type', ''):
+                        audio_url = enclosure.get('href') or enclosure.get('url')
+                        break
+
+                if not audio_url:
+                    logger.warning(f"No audio found in latest {source_name} bulletin")
+                    return None
+
+                guid = latest_entry.get('id') or audio_url
+                title = latest_entry.get('title', 'Unknown')
+            else:
+                audio_url, guid, title = latest
+
+            # Skip the download entirely when the latest item is the same
+            # episode as last run and its audio is still in the cache
+            with self._guid_lock:
+                cached_entry = self._guid_cache.get(feed_url)
+            if cached_entry and cached_entry.get('guid') == guid:
+                cached_file = self.cache_dir / cached_entry.get('file', '')
+                if cached_entry.get('file') and cached_file.is_file():
+                    logger.info(f"{source_name} episode unchanged; using cached {cached_file.name}")
+                    return cached_file
 
             # Download the audio file
-            logger.info(f"Downloading from {source_name}: {latest_entry.get('title', 'Unknown')}")
-            response = requests.get(audio_url, timeout=60)
-            response.raise_for_status()
+            logger.info(f"Downloading from {source_name}: {title}")
 
-            # Save to temp directory
+            # Save to the cache directory so the next run can reuse it
             file_extension = audio_url.split('.')[-1].split('?')[0]
             if file_extension not in ['mp3', 'wav', 'm4a', 'aac']:
                 file_extension = 'mp3'
 
-            filename = self.temp_dir / f"{source_name.replace(' ', '_')}.{file_extension}"
-            filename.write_bytes(response.content)
+            filename = self.cache_dir / f"{source_name.replace(' ', '_')}.{file_extension}"
+
+            # Unique in-flight name per call: two concurrent generates for
+            # the same source would otherwise interleave writes into one
+            # .part file and the rename below would publish the corrupted
+            # blend into the cache
+            part_path = filename.with_name(
+                f"{filename.name}.{uuid.uuid4().hex}.part")
+
+            # Stream the download straight to disk in 64KB chunks - with
+            # several sources downloading concurrently, buffering whole
+            # files in RAM would cost the sum of their sizes in peak RSS.
+            # The cap matches the 25MB email attachment limit.
+            max_bytes = 25 * 1024 * 1024
+            bytes_written = 0
+            try:
+                with self.session.get(audio_url, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    with open(part_path, 'wb') as audio_out:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            bytes_written += len(chunk)
+                            if bytes_written > max_bytes:
+                                raise ValueError(
+                                    f"{source_name} bulletin exceeds 25MB download cap")
+                            audio_out.write(chunk)
+            except Exception:
+                # Drop the partial download so it can't be combined later
+                part_path.unlink(missing_ok=True)
+                raise
+
+            # Atomic rename: the cache never holds a half-written file
+            os.replace(part_path, filename)
+            self._store_guid(feed_url, guid, filename.name)
 
             logger.info(f"Downloaded {source_name} bulletin: {filename}")
             return filename
@@ -99,6 +250,69 @@ class NewsBulletinAggregator:
             logger.error(f"Error fetching {source_name}: {str(e)}")
             return None
 
+    def _probe_audio_params(self, audio_file):
+        """
+        (codec, sample_rate, channels) of the first audio stream
+
+        Prefers an in-process mutagen header parse - a few KB read, no
+        subprocess - and falls back to ffprobe for non-MP3 files, broken
+        headers, or when mutagen isn't installed.
+        """
+        if MutagenMP3 is not None and audio_file.suffix.lower() == '.mp3':
+            try:
+                info = MutagenMP3(str(audio_file)).info
+                return ('mp3', int(info.sample_rate), int(info.channels))
+            except Exception:
+                pass  # unreadable as MP3 - let ffprobe classify it
+
+        output = subprocess.check_output(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'stream=codec_name,sample_rate,channels',
+             '-of', 'default=nw=1', str(audio_file)],
+            timeout=15)
+        params = dict(line.split('=', 1)
+                      for line in output.decode().strip().splitlines())
+        return (params['codec_name'], int(params['sample_rate']),
+                int(params['channels']))
+
+    def _combine_with_ffmpeg(self, audio_files, output_path):
+        """
+        Concatenate MP3s without re-encoding via ffmpeg's concat demuxer
+
+        Only valid when every input shares codec, sample rate and channel
+        count - raises ValueError otherwise so the caller can fall back to
+        the decode + re-encode path.
+        """
+        stream_params = {self._probe_audio_params(f) for f in audio_files}
+        if len(stream_params) != 1:
+            raise ValueError(f"Mixed audio parameters: {stream_params}")
+        codec, sample_rate, channels = stream_params.pop()
+        if codec != 'mp3':
+            raise ValueError(f"Non-MP3 codec: {codec}")
+
+        # 2-second silence clip encoded with matching parameters so the
+        # stream copy stays valid across the joins; cached per parameter set
+        silence_file = self.temp_dir / f'silence_{sample_rate}_{channels}.mp3'
+        if not silence_file.exists():
+            layout = 'mono' if channels == 1 else 'stereo'
+            subprocess.run(
+                ['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi',
+                 '-i', f'anullsrc=r={sample_rate}:cl={layout}',
+                 '-t', '2', '-c:a', 'libmp3lame', str(silence_file)],
+                check=True, timeout=60)
+
+        list_file = self.temp_dir / 'concat_list.txt'
+        lines = []
+        for audio_file in audio_files:
+            lines.append(f"file '{audio_file.resolve()}'")
+            lines.append(f"file '{silence_file.resolve()}'")
+        list_file.write_text('\n'.join(lines) + '\n')
+
+        subprocess.run(
+            ['ffmpeg', '-y', '-v', 'error', '-f', 'concat', '-safe', '0',
+             '-i', str(list_file), '-c', 'copy', str(output_path)],
+            check=True, timeout=300)
+
     def combine_audio_files(self, audio_files, output_filename):
         """
         Combine multiple audio files into one
@@ -115,24 +329,48 @@ class NewsBulletinAggregator:
 
         logger.info(f"Combining {len(audio_files)} audio files...")
 
-        combined = AudioSegment.empty()
+        # Fast path: when every input is an MP3 with identical stream
+        # parameters, the concat demuxer joins them as a pure bytestream
+        # copy - no decode to PCM, no LAME re-encode of the whole bulletin
+        output_path = self.output_dir / output_filename
+        try:
+            self._combine_with_ffmpeg(audio_files, output_path)
+            logger.info(f"Combined audio saved to {output_path} (stream copy)")
+            return output_path
+        except (OSError, subprocess.SubprocessError, ValueError, KeyError) as e:
+            logger.info(f"Stream-copy concat unavailable ({e}); re-encoding with pydub")
+
+        from pydub import AudioSegment
+
+        # Decode every file first, then join once at the end - appending to
+        # an accumulator copies the whole buffer each iteration (quadratic
+        # bytes moved), while a single join over the list is linear
+        segments = []
+        silence = None
 
         for audio_file in audio_files:
             try:
                 logger.info(f"Adding {audio_file.name}...")
                 audio = AudioSegment.from_file(str(audio_file))
-                combined += audio
-
-                # Add 2 second silence between bulletins
-                silence = AudioSegment.silent(duration=2000)
-                combined += silence
-
             except Exception as e:
                 logger.error(f"Error processing {audio_file}: {str(e)}")
                 continue
 
+            if silence is None:
+                # 2 second silence between bulletins, generated once to
+                # match the first bulletin's parameters so the raw-bytes
+                # join below stays applicable
+                silence = (AudioSegment
+                           .silent(duration=2000, frame_rate=audio.frame_rate)
+                           .set_channels(audio.channels)
+                           .set_sample_width(audio.sample_width))
+
+            segments.append(audio)
+            segments.append(silence)
+
+        combined = self._join_segments(segments)
+
         # Save combined file
-        output_path = self.output_dir / output_filename
         combined.export(str(output_path), format='mp3')
 
         logger.info(f"Combined audio saved to {output_path}")
@@ -140,28 +378,131 @@ class NewsBulletinAggregator:
 
         return output_path
 
+    @staticmethod
+    def _join_segments(segments):
+        """
+        Join decoded segments into one AudioSegment with a single copy
+
+        When every segment shares frame rate, sample width and channel
+        count the raw PCM buffers are joined directly; otherwise pydub
+        appends segment by segment and resamples as needed.
+        """
+        if not segments:
+            from pydub import AudioSegment
+            return AudioSegment.empty()
+
+        first = segments[0]
+        if all(s.frame_rate == first.frame_rate
+               and s.sample_width == first.sample_width
+               and s.channels == first.channels for s in segments):
+            return first._spawn(b''.join(s.raw_data for s in segments))
+
+        combined = first
+        for segment in segments[1:]:
+            combined += segment
+        return combined
+
+    @staticmethod
+    def _first_enclosure(feed_bytes):
+        """
+        (audio_url, guid, title) of a feed's first item via streaming parse
+
+        Walks the XML incrementally and stops at the first <item>, so the
+        rest of the feed is never parsed. Returns None for anything that
+        doesn't match the plain-RSS shape (Atom, namespaced enclosures,
+        malformed XML) - the caller falls back to feedparser for those.
+        """
+        try:
+            for _, elem in ElementTree.iterparse(BytesIO(feed_bytes),
+                                                 events=('end',)):
+                if not elem.tag.endswith('item'):
+                    continue
+                enclosure = elem.find('enclosure')
+                if enclosure is None:
+                    return None
+                audio_url = enclosure.get('url')
+                if not audio_url or 'audio' not in (enclosure.get('type') or ''):
+                    return None
+                guid = elem.findtext('guid') or audio_url
+                title = elem.findtext('title') or 'Unknown'
+                return (audio_url, guid, title)
+        except ElementTree.ParseError:
+            return None
+        return None
+
+    def _store_etag(self, feed_url, etag):
+        """Record a feed's ETag and persist the cache for the next run"""
+        with self._etag_lock:
+            if self._etags.get(feed_url) == etag:
+                return
+            self._etags[feed_url] = etag
+            try:
+                self._etag_file.write_text(json.dumps(self._etags, indent=2))
+            except OSError as e:
+                logger.error(f"Could not persist feed ETags: {str(e)}")
+
+    def _store_guid(self, feed_url, guid, cached_filename):
+        """Record the latest episode GUID and cached file for a feed"""
+        with self._guid_lock:
+            self._guid_cache[feed_url] = {'guid': guid, 'file': cached_filename}
+            try:
+                self._guid_file.write_text(json.dumps(self._guid_cache, indent=2))
+            except OSError as e:
+                logger.error(f"Could not persist episode GUIDs: {str(e)}")
+
+    def _report_progress(self, message):
+        """Push a progress message to the attached queue, if any"""
+        if self.progress_queue is not None:
+            self.progress_queue.put(message)
+
     def cleanup_temp_files(self):
         """Remove temporary downloaded files"""
-        for file in self.temp_dir.iterdir():
-            if file.is_file():
-                file.unlink()
+        # One C-level tree removal instead of a stat + unlink per entry;
+        # recreate the directory empty for the next run
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
         logger.info("Cleaned up temporary files")
 
     def generate_daily_bulletin(self):
         """Main method to generate combined daily bulletin"""
         logger.info("Starting news bulletin aggregation...")
 
-        # Fetch latest bulletins from all sources
-        downloaded_files = []
-        for source_name, feed_url in self.news_sources.items():
-            audio_file = self.fetch_latest_bulletin(source_name, feed_url)
-            if audio_file:
-                downloaded_files.append(audio_file)
+        # Fetch latest bulletins from all sources concurrently - each fetch
+        # is independent network I/O, so wall time drops from the sum of
+        # feed latencies to the slowest single source. Temp filenames are
+        # per-source, so workers never write the same file.
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(8, max(1, len(self.news_sources)))) as executor:
+            futures = {
+                executor.submit(self.fetch_latest_bulletin, name, url): name
+                for name, url in self.news_sources.items()
+            }
+            for future in as_completed(futures):
+                source_name = futures[future]
+                # fetch_latest_bulletin catches its own errors and returns
+                # None, but guard so one unexpected worker failure can't
+                # abort the whole batch
+                try:
+                    results[source_name] = future.result()
+                except Exception as e:
+                    logger.error(f"Fetch worker failed for {source_name}: {str(e)}")
+                    results[source_name] = None
+                if results[source_name]:
+                    self._report_progress(f"Downloaded {source_name}")
+                else:
+                    self._report_progress(f"No audio available from {source_name}")
+
+        # Preserve the configured source order in the combined bulletin
+        downloaded_files = [
+            results[name] for name in self.news_sources if results.get(name)
+        ]
 
         if not downloaded_files:
             logger.error("No audio files were downloaded successfully")
             return None
 
+        self._report_progress(f"Combining {len(downloaded_files)} bulletins...")
+
         # Combine all bulletins
         today = datetime.now().strftime('%Y-%m-%d')
         output_filename = f"news_bulletin_{today}.mp3"
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for production deployment
+
+The Werkzeug dev server started by `python3 app.py` serialises requests
+and is only meant for local development. In production run a threaded
+WSGI server - the hot paths (feed downloads, file serving, SMTP) are
+I/O-bound, so threads matter more than extra processes:
+
+    gunicorn -k gthread -w 2 --threads 8 -b 0.0.0.0:5000 wsgi:application
+"""
+
+from app import OUTPUT_DIR, app as application
+
+# Ensure output directory exists
+OUTPUT_DIR.mkdir(exist_ok=True)